@@ -10,6 +10,7 @@ from typing import Sequence, Union
 
 import sqlalchemy as sa
 from alembic import op
+from sqlalchemy.schema import CreateIndex, CreateTable, ExecutableDDLElement
 
 # revision identifiers, used by Alembic.
 revision: str = "001"
@@ -18,11 +19,16 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def upgrade() -> None:
-    """Apply migration."""
-    op.create_table(
+def _users_table() -> sa.Table:
+    """Build the users table as of this revision.
+
+    Returns:
+        The users table definition.
+    """
+    return sa.Table(
         "users",
-        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.MetaData(),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
         sa.Column("email", sa.String(length=255), nullable=False),
         sa.Column("hashed_password", sa.String(length=255), nullable=True),
         sa.Column("name", sa.String(length=255), nullable=False),
@@ -44,13 +50,42 @@ def upgrade() -> None:
             server_default=sa.text("now()"),
         ),
         sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email", name="ix_users_email"),
+        sa.UniqueConstraint("external_id", name="ix_users_external_id"),
+        sa.Index("ix_users_created_at", sa.text("created_at DESC")),
     )
-    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
-    op.create_index(op.f("ix_users_external_id"), "users", ["external_id"], unique=True)
+
+
+def _execute_batch(statements: list[ExecutableDDLElement]) -> None:
+    """Execute DDL statements in a single round-trip where supported.
+
+    On PostgreSQL the statements are compiled and sent as one anonymous
+    code block (asyncpg cannot prepare multiple statements at once).
+    Other dialects execute them one by one.
+
+    Args:
+        statements: DDL statements to execute in order.
+    """
+    dialect = op.get_context().dialect
+    if dialect.name != "postgresql":
+        for statement in statements:
+            op.execute(statement)
+        return
+
+    body = ";\n".join(
+        str(statement.compile(dialect=dialect)).strip() for statement in statements
+    )
+    op.execute(f"DO $$ BEGIN\n{body};\nEND $$")
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    users = _users_table()
+    indexes = sorted(users.indexes, key=lambda index: str(index.name))
+    _execute_batch([CreateTable(users), *(CreateIndex(index) for index in indexes)])
 
 
 def downgrade() -> None:
     """Revert migration."""
-    op.drop_index(op.f("ix_users_external_id"), table_name="users")
-    op.drop_index(op.f("ix_users_email"), table_name="users")
+    # Unique constraints are dropped together with the table
     op.drop_table("users")
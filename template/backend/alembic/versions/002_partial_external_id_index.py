@@ -0,0 +1,38 @@
+"""Index users.external_id only where it is set.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    # Replace the full unique constraint with a partial unique index
+    op.drop_constraint("ix_users_external_id", "users", type_="unique")
+    op.create_index(
+        "ix_users_external_id",
+        "users",
+        ["external_id"],
+        unique=True,
+        postgresql_where=sa.text("external_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_index("ix_users_external_id", table_name="users")
+    op.create_unique_constraint("ix_users_external_id", "users", ["external_id"])
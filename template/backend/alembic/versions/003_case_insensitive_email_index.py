@@ -0,0 +1,37 @@
+"""Make users.email unique regardless of case.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply migration."""
+    # Fails if existing emails differ only in case; merge those first
+    op.drop_constraint("ix_users_email", "users", type_="unique")
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Revert migration."""
+    op.drop_index("ix_users_email_lower", table_name="users")
+    op.create_unique_constraint("ix_users_email", "users", ["email"])
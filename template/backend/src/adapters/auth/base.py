@@ -4,10 +4,10 @@ This module defines the abstract base class for authentication providers.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthUser:
     """Authenticated user information.
 
@@ -16,12 +16,15 @@ class AuthUser:
         email: User's email address.
         name: User's display name.
         external_id: External ID from auth provider (e.g., Cognito sub).
+        expires_at: Unix time at which the verified token expires, if known.
+            Not part of the user's identity in comparisons or hashing.
     """
 
     id: str
     email: str
     name: str
     external_id: str | None = None
+    expires_at: float | None = field(default=None, compare=False)
 
 
 class AuthProvider(ABC):
@@ -40,6 +43,8 @@ class AuthProvider(ABC):
         ```
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def authenticate(self, email: str, password: str) -> AuthUser | None:
         """Authenticate a user with email and password.
@@ -4,7 +4,16 @@ This module provides authentication via AWS Cognito User Pools.
 Requires the 'aws' optional dependencies to be installed.
 """
 
-from typing import TYPE_CHECKING
+import asyncio
+import hashlib
+import json
+import time
+import urllib.request
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+import jwt
+from jwt import PyJWK, PyJWTError
 
 from src.adapters.auth.base import (
     AuthenticationError,
@@ -13,10 +22,49 @@ from src.adapters.auth.base import (
     UserExistsError,
 )
 from src.config import get_settings
+from src.core.cache import TTLCache
 from src.core.logging import logger
 
 if TYPE_CHECKING:
     from mypy_boto3_cognito_idp import CognitoIdentityProviderClient
+    from mypy_boto3_cognito_idp.type_defs import AttributeTypeTypeDef
+
+# Verified tokens are remembered for at most this many seconds
+TOKEN_CACHE_TTL = 300
+TOKEN_CACHE_SIZE = 10_000
+
+# Keep-alive connections shared by concurrent Cognito calls
+MAX_POOL_CONNECTIONS = 50
+
+# Minimum seconds between JWKS refetches triggered by unknown key IDs, so
+# tokens with made-up key IDs can't turn into a flood of JWKS requests
+JWKS_REFRESH_INTERVAL = 60
+
+# Failures of a JWKS fetch: network errors, bad JSON and unusable keys
+JWKS_FETCH_ERRORS = (OSError, ValueError, KeyError, PyJWTError)
+
+
+def _parse_attrs(
+    attrs: Sequence["AttributeTypeTypeDef"],
+) -> tuple[str | None, str | None, str | None]:
+    """Extract the attributes used by AuthUser in a single pass.
+
+    Args:
+        attrs: Cognito UserAttributes list of Name/Value pairs.
+
+    Returns:
+        Tuple of (sub, email, name); missing attributes are None.
+    """
+    sub = email = name = None
+    for attr in attrs:
+        attr_name = attr["Name"]
+        if attr_name == "sub":
+            sub = attr["Value"]
+        elif attr_name == "email":
+            email = attr["Value"]
+        elif attr_name == "name":
+            name = attr["Value"]
+    return sub, email, name
 
 
 class CognitoAuthProvider(AuthProvider):
@@ -25,12 +73,34 @@ class CognitoAuthProvider(AuthProvider):
     Uses AWS Cognito User Pools for authentication.
     Requires AWS credentials to be configured.
 
+    Access tokens are verified locally against the user pool's JWKS.
+    Cognito is only called the first time a token is seen, to resolve
+    the user's attributes, and the result is cached until the token
+    expires (at most TOKEN_CACHE_TTL seconds). Blocking boto3 calls run
+    in worker threads so they never stall the event loop.
+
     Attributes:
         _client: Boto3 Cognito IDP client.
         _user_pool_id: Cognito User Pool ID.
         _client_id: Cognito App Client ID.
+        _issuer: Expected token issuer URL.
+        _jwks: User pool signing keys keyed by key ID.
+        _jwks_fetched_at: Monotonic time of the last JWKS fetch attempt.
+        _jwks_lock: Serializes JWKS refetches.
+        _token_cache: Verified users keyed by token digest.
     """
 
+    __slots__ = (
+        "_client",
+        "_user_pool_id",
+        "_client_id",
+        "_issuer",
+        "_jwks",
+        "_jwks_fetched_at",
+        "_jwks_lock",
+        "_token_cache",
+    )
+
     def __init__(self) -> None:
         """Initialize Cognito provider.
 
@@ -40,6 +110,7 @@ class CognitoAuthProvider(AuthProvider):
         """
         try:
             import boto3
+            from botocore.config import Config
         except ImportError as e:
             raise ImportError(
                 "boto3 is required for Cognito auth. "
@@ -53,12 +124,113 @@ class CognitoAuthProvider(AuthProvider):
         if not settings.aws_cognito_client_id:
             raise ValueError("AWS_COGNITO_CLIENT_ID is required")
 
-        self._client: CognitoIdentityProviderClient = boto3.client(
+        session = boto3.session.Session()
+        self._client: CognitoIdentityProviderClient = session.client(
             "cognito-idp",
             region_name=settings.aws_region,
+            config=Config(
+                max_pool_connections=MAX_POOL_CONNECTIONS,
+                retries={"max_attempts": 2, "mode": "adaptive"},
+                tcp_keepalive=True,
+            ),
         )
         self._user_pool_id = settings.aws_cognito_user_pool_id
         self._client_id = settings.aws_cognito_client_id
+        self._issuer = (
+            f"https://cognito-idp.{settings.aws_region}.amazonaws.com/"
+            f"{settings.aws_cognito_user_pool_id}"
+        )
+        # A failed startup fetch leaves the JWKS empty; the first token
+        # then refetches it through _get_signing_key
+        self._jwks: dict[str, PyJWK] = {}
+        self._jwks_fetched_at = float("-inf")
+        try:
+            self._jwks = self._fetch_jwks()
+            self._jwks_fetched_at = time.monotonic()
+        except JWKS_FETCH_ERRORS as e:
+            logger.warning("JWKS fetch failed", error=str(e))
+        self._jwks_lock = asyncio.Lock()
+        self._token_cache: TTLCache[bytes, AuthUser] = TTLCache(
+            maxsize=TOKEN_CACHE_SIZE,
+            ttl=TOKEN_CACHE_TTL,
+        )
+
+    def _fetch_jwks(self) -> dict[str, PyJWK]:
+        """Fetch the user pool's public signing keys.
+
+        Returns:
+            JSON Web Keys keyed by key ID.
+        """
+        url = f"{self._issuer}/.well-known/jwks.json"
+        with urllib.request.urlopen(url, timeout=10) as response:
+            jwks = json.load(response)
+        return {key["kid"]: PyJWK(key) for key in jwks["keys"]}
+
+    async def _get_signing_key(self, kid: str) -> PyJWK | None:
+        """Look up a signing key, refetching the JWKS for unknown key IDs.
+
+        Cognito rotates its signing keys, so a key ID missing from the
+        cached JWKS triggers one refetch, at most every
+        JWKS_REFRESH_INTERVAL seconds.
+
+        Args:
+            kid: Key ID from the token header.
+
+        Returns:
+            The signing key, or None if the user pool has no such key.
+        """
+        key = self._jwks.get(kid)
+        if key is not None:
+            return key
+
+        async with self._jwks_lock:
+            # Another request may have refetched while this one waited
+            key = self._jwks.get(kid)
+            if key is not None:
+                return key
+            if time.monotonic() - self._jwks_fetched_at < JWKS_REFRESH_INTERVAL:
+                return None
+
+            self._jwks_fetched_at = time.monotonic()
+            try:
+                self._jwks = await asyncio.to_thread(self._fetch_jwks)
+            except JWKS_FETCH_ERRORS as e:
+                logger.warning("JWKS refresh failed", error=str(e))
+                return None
+
+        return self._jwks.get(kid)
+
+    async def _decode_token(self, token: str) -> dict[str, Any] | None:
+        """Verify an access token's signature and claims locally.
+
+        Args:
+            token: Cognito access token.
+
+        Returns:
+            The token claims, or None if the token is invalid.
+        """
+        try:
+            kid = jwt.get_unverified_header(token).get("kid", "")
+            key = await self._get_signing_key(kid)
+            if key is None:
+                return None
+
+            claims: dict[str, Any] = jwt.decode(
+                token,
+                key.key,
+                algorithms=["RS256"],
+                issuer=self._issuer,
+                options={"verify_aud": False},
+            )
+        except PyJWTError:
+            return None
+
+        if claims.get("token_use") != "access":
+            return None
+        if claims.get("client_id") != self._client_id:
+            return None
+
+        return claims
 
     async def authenticate(self, email: str, password: str) -> AuthUser | None:
         """Authenticate a user with Cognito.
@@ -74,7 +246,8 @@ class CognitoAuthProvider(AuthProvider):
             AuthenticationError: If credentials are invalid.
         """
         try:
-            response = self._client.initiate_auth(
+            response = await asyncio.to_thread(
+                self._client.initiate_auth,
                 ClientId=self._client_id,
                 AuthFlow="USER_PASSWORD_AUTH",
                 AuthParameters={
@@ -85,17 +258,20 @@ class CognitoAuthProvider(AuthProvider):
 
             # Get user attributes
             access_token = response["AuthenticationResult"]["AccessToken"]
-            user_response = self._client.get_user(AccessToken=access_token)
+            user_response = await asyncio.to_thread(
+                self._client.get_user,
+                AccessToken=access_token,
+            )
 
-            attributes = {
-                attr["Name"]: attr["Value"] for attr in user_response["UserAttributes"]
-            }
+            sub, user_email, user_name = _parse_attrs(
+                user_response["UserAttributes"]
+            )
 
             return AuthUser(
-                id=attributes.get("sub", email),
-                email=attributes.get("email", email),
-                name=attributes.get("name", email),
-                external_id=attributes.get("sub"),
+                id=sub or email,
+                email=user_email or email,
+                name=user_name or email,
+                external_id=sub,
             )
 
         except self._client.exceptions.NotAuthorizedException:
@@ -115,23 +291,41 @@ class CognitoAuthProvider(AuthProvider):
         Returns:
             AuthUser if token is valid, None otherwise.
         """
-        try:
-            response = self._client.get_user(AccessToken=token)
-            attributes = {
-                attr["Name"]: attr["Value"] for attr in response["UserAttributes"]
-            }
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached_user = self._token_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
 
-            return AuthUser(
-                id=attributes.get("sub", ""),
-                email=attributes.get("email", ""),
-                name=attributes.get("name", attributes.get("email", "")),
-                external_id=attributes.get("sub"),
-            )
+        claims = await self._decode_token(token)
+        if claims is None:
+            return None
 
+        # Access tokens carry no email/name claims, so resolve them once
+        try:
+            response = await asyncio.to_thread(
+                self._client.get_user,
+                AccessToken=token,
+            )
+            sub, user_email, user_name = _parse_attrs(response["UserAttributes"])
         except Exception as e:
             logger.warning("Token verification failed", error=str(e))
             return None
 
+        expires_at = float(claims.get("exp", 0))
+        auth_user = AuthUser(
+            id=sub or "",
+            email=user_email or "",
+            name=user_name or user_email or "",
+            external_id=sub,
+            expires_at=expires_at,
+        )
+        self._token_cache.set(
+            cache_key,
+            auth_user,
+            ttl=min(TOKEN_CACHE_TTL, expires_at - time.time()),
+        )
+        return auth_user
+
     async def create_user(
         self,
         email: str,
@@ -152,7 +346,8 @@ class CognitoAuthProvider(AuthProvider):
             UserExistsError: If a user with this email already exists.
         """
         try:
-            response = self._client.sign_up(
+            response = await asyncio.to_thread(
+                self._client.sign_up,
                 ClientId=self._client_id,
                 Username=email,
                 Password=password,
@@ -185,7 +380,8 @@ class CognitoAuthProvider(AuthProvider):
             True if user was deleted, False if user not found.
         """
         try:
-            self._client.admin_delete_user(
+            await asyncio.to_thread(
+                self._client.admin_delete_user,
                 UserPoolId=self._user_pool_id,
                 Username=email,
             )
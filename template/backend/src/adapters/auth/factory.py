@@ -4,18 +4,23 @@ This module provides a factory function to get the appropriate
 authentication provider based on configuration.
 """
 
-from functools import lru_cache
+import threading
 
 from src.adapters.auth.base import AuthProvider
 from src.config import get_settings
 
+_provider: AuthProvider | None = None
+# Startup builds the provider in a worker thread while requests may ask
+# for it too; the lock makes sure only one instance is ever built
+_provider_lock = threading.Lock()
+
 
-@lru_cache
 def get_auth_provider() -> AuthProvider:
     """Get the configured authentication provider.
 
     Returns the appropriate AuthProvider implementation based on
-    the AUTH_PROVIDER environment variable.
+    the AUTH_PROVIDER environment variable. The provider is created
+    on first use and shared by all later calls.
 
     Returns:
         AuthProvider instance.
@@ -35,6 +40,23 @@ def get_auth_provider() -> AuthProvider:
             user = await auth.authenticate(email, password)
         ```
     """
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = _build_provider()
+    return _provider
+
+
+def _build_provider() -> AuthProvider:
+    """Create the AuthProvider selected by configuration.
+
+    Returns:
+        AuthProvider instance.
+
+    Raises:
+        ValueError: If an unknown provider is configured.
+    """
     settings = get_settings()
 
     if settings.auth_provider == "mock":
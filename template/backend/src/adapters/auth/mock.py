@@ -5,6 +5,8 @@ users in memory. Useful for local development without external
 dependencies.
 """
 
+from dataclasses import replace
+
 from src.adapters.auth.base import (
     AuthenticationError,
     AuthProvider,
@@ -15,9 +17,13 @@ from src.core.security import (
     create_access_token,
     decode_access_token,
     get_password_hash,
+    pwd_context,
     verify_password,
 )
 
+# Hashed once per process so every provider instance shares the seed user
+_SEED_HASH = pwd_context.hash("password")
+
 
 class MockAuthProvider(AuthProvider):
     """Mock authentication provider for development.
@@ -26,19 +32,20 @@ class MockAuthProvider(AuthProvider):
     Pre-populated with a test user for convenience.
 
     Attributes:
-        _users: Dictionary of users keyed by email.
+        _users: Users keyed by email.
+        _hashes: Password hashes keyed by email.
     """
 
+    __slots__ = ("_users", "_hashes")
+
     def __init__(self) -> None:
         """Initialize mock provider with a test user."""
         # Pre-populate with a test user
-        self._users: dict[str, dict[str, str]] = {
-            "test@example.com": {
-                "email": "test@example.com",
-                "name": "Test User",
-                "hashed_password": get_password_hash("password"),
-            }
+        email = "test@example.com"
+        self._users: dict[str, AuthUser] = {
+            email: AuthUser(id=email, email=email, name="Test User"),
         }
+        self._hashes: dict[str, str] = {email: _SEED_HASH}
 
     async def authenticate(self, email: str, password: str) -> AuthUser | None:
         """Authenticate a user with email and password.
@@ -53,18 +60,14 @@ class MockAuthProvider(AuthProvider):
         Raises:
             AuthenticationError: If credentials are invalid.
         """
-        user = self._users.get(email)
-        if not user:
+        hashed_password = self._hashes.get(email)
+        if not hashed_password:
             raise AuthenticationError("Invalid email or password")
 
-        if not verify_password(password, user["hashed_password"]):
+        if not await verify_password(password, hashed_password):
             raise AuthenticationError("Invalid email or password")
 
-        return AuthUser(
-            id=email,
-            email=email,
-            name=user["name"],
-        )
+        return self._users[email]
 
     async def verify_token(self, token: str) -> AuthUser | None:
         """Verify a JWT token.
@@ -84,14 +87,9 @@ class MockAuthProvider(AuthProvider):
             return None
 
         user = self._users.get(email)
-        if not user:
+        if user is None:
             return None
-
-        return AuthUser(
-            id=email,
-            email=email,
-            name=user["name"],
-        )
+        return replace(user, expires_at=payload.get("exp"))
 
     async def create_user(
         self,
@@ -115,17 +113,17 @@ class MockAuthProvider(AuthProvider):
         if email in self._users:
             raise UserExistsError(f"User with email {email} already exists")
 
-        self._users[email] = {
-            "email": email,
-            "name": name,
-            "hashed_password": get_password_hash(password),
-        }
+        hashed_password = await get_password_hash(password)
 
-        return AuthUser(
-            id=email,
-            email=email,
-            name=name,
-        )
+        # Another request may have registered the email while hashing
+        if email in self._users:
+            raise UserExistsError(f"User with email {email} already exists")
+
+        user = AuthUser(id=email, email=email, name=name)
+        self._hashes[email] = hashed_password
+        self._users[email] = user
+
+        return user
 
     async def delete_user(self, email: str) -> bool:
         """Delete a user.
@@ -136,10 +134,10 @@ class MockAuthProvider(AuthProvider):
         Returns:
             True if user was deleted, False if user not found.
         """
-        if email in self._users:
-            del self._users[email]
-            return True
-        return False
+        if self._users.pop(email, None) is None:
+            return False
+        del self._hashes[email]
+        return True
 
     def create_token(self, email: str) -> str:
         """Create a JWT token for a user.
@@ -4,10 +4,15 @@ This module defines the abstract base class for storage providers.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from typing import BinaryIO
 
+# Default chunk size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class StorageFile:
     """Stored file information.
 
@@ -40,6 +45,8 @@ class StorageProvider(ABC):
         ```
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def upload(
         self,
@@ -62,6 +69,45 @@ class StorageProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    async def upload_stream(
+        self,
+        key: str,
+        fileobj: BinaryIO,
+        content_type: str = "application/octet-stream",
+    ) -> StorageFile:
+        """Upload a file from a file-like object.
+
+        Prefer this over upload() for large files: the content is read
+        in chunks instead of being held in memory as a whole.
+
+        Args:
+            key: Unique identifier/path for the file.
+            fileobj: Binary file object read from its current position
+                to the end, e.g. ``UploadFile.file``.
+            content_type: MIME type of the file.
+
+        Returns:
+            StorageFile with file information.
+
+        Raises:
+            StorageError: If upload fails.
+
+        Example:
+            ```python
+            @router.post("/upload")
+            async def upload_file(
+                file: UploadFile,
+                storage: StorageProvider = Depends(get_storage_provider),
+            ):
+                result = await storage.upload_stream(
+                    file.filename, file.file, file.content_type
+                )
+                return {"url": result.url}
+            ```
+        """
+        pass
+
     @abstractmethod
     async def download(self, key: str) -> bytes:
         """Download a file.
@@ -78,6 +124,43 @@ class StorageProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def download_stream(
+        self,
+        key: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Download a file as a stream of chunks.
+
+        Prefer this over download() for large files: memory use stays
+        bounded by chunk_size instead of the file size.
+        Errors are raised when iteration starts.
+
+        Args:
+            key: Unique identifier/path for the file.
+            chunk_size: Maximum size of each chunk in bytes.
+
+        Yields:
+            File content in chunks.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            StorageError: If download fails.
+
+        Example:
+            ```python
+            from fastapi.responses import StreamingResponse
+
+            @router.get("/files/{key:path}")
+            async def download_file(
+                key: str,
+                storage: StorageProvider = Depends(get_storage_provider),
+            ):
+                return StreamingResponse(storage.download_stream(key))
+            ```
+        """
+        pass
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """Delete a file.
@@ -86,7 +169,9 @@ class StorageProvider(ABC):
             key: Unique identifier/path for the file.
 
         Returns:
-            True if file was deleted, False if file not found.
+            True if file was deleted, False if file not found. Providers
+            whose delete is idempotent (e.g. S3) may return True without
+            checking whether the file existed.
 
         Raises:
             StorageError: If deletion fails.
@@ -97,6 +182,9 @@ class StorageProvider(ABC):
     async def get_url(self, key: str, expires_in: int = 3600) -> str:
         """Get a URL to access a file.
 
+        Providers may skip checking that the file exists, in which case
+        requesting the URL of a missing file fails with 404.
+
         Args:
             key: Unique identifier/path for the file.
             expires_in: URL expiration time in seconds (for signed URLs).
@@ -105,7 +193,7 @@ class StorageProvider(ABC):
             URL to access the file.
 
         Raises:
-            FileNotFoundError: If file does not exist.
+            FileNotFoundError: If the provider checks and the file does not exist.
         """
         pass
 
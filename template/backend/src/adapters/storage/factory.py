@@ -4,18 +4,23 @@ This module provides a factory function to get the appropriate
 storage provider based on configuration.
 """
 
-from functools import lru_cache
+import threading
 
 from src.adapters.storage.base import StorageProvider
 from src.config import get_settings
 
+_provider: StorageProvider | None = None
+# Startup builds the provider in a worker thread while requests may ask
+# for it too; the lock makes sure only one instance is ever built
+_provider_lock = threading.Lock()
+
 
-@lru_cache
 def get_storage_provider() -> StorageProvider:
     """Get the configured storage provider.
 
     Returns the appropriate StorageProvider implementation based on
-    the STORAGE_PROVIDER environment variable.
+    the STORAGE_PROVIDER environment variable. The provider is created
+    on first use and shared by all later calls.
 
     Returns:
         StorageProvider instance.
@@ -38,6 +43,23 @@ def get_storage_provider() -> StorageProvider:
             return {"url": result.url}
         ```
     """
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = _build_provider()
+    return _provider
+
+
+def _build_provider() -> StorageProvider:
+    """Create the StorageProvider selected by configuration.
+
+    Returns:
+        StorageProvider instance.
+
+    Raises:
+        ValueError: If an unknown provider is configured.
+    """
     settings = get_settings()
 
     if settings.storage_provider == "local":
@@ -4,10 +4,24 @@ This module provides file storage using the local filesystem.
 Useful for local development without external dependencies.
 """
 
+import asyncio
+import io
 import os
+import re
+import shutil
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import BinaryIO
 
-from src.adapters.storage.base import StorageError, StorageFile, StorageProvider
+from src.adapters.storage.base import (
+    DOWNLOAD_CHUNK_SIZE,
+    StorageError,
+    StorageFile,
+    StorageProvider,
+)
+
+# Matches a ".." segment anywhere in a key (but not "my..backup.tar")
+_PARENT_SEGMENT = re.compile(r"(?:^|/)\.\.(?:/|$)")
 
 
 class LocalStorageProvider(StorageProvider):
@@ -20,6 +34,8 @@ class LocalStorageProvider(StorageProvider):
         _base_url: Base URL for accessing files.
     """
 
+    __slots__ = ("_base_path", "_base_url")
+
     def __init__(
         self,
         base_path: str = "storage",
@@ -45,10 +61,40 @@ class LocalStorageProvider(StorageProvider):
 
         Returns:
             Full path to the file.
+
+        Raises:
+            ValueError: If the key would escape the storage directory.
         """
-        # Sanitize key to prevent directory traversal
-        safe_key = key.lstrip("/").replace("..", "")
-        return self._base_path / safe_key
+        # Reject directory traversal instead of rewriting the key
+        if _PARENT_SEGMENT.search(key):
+            raise ValueError(f"Invalid file key: {key}")
+        return self._base_path / key.lstrip("/")
+
+    @staticmethod
+    def _write_file(file_path: Path, fileobj: BinaryIO) -> int:
+        """Copy a stream into a file, creating parent directories if missing.
+
+        The file is opened first and parent directories are only created
+        when the open fails, so uploads into an existing prefix skip the
+        directory walk.
+
+        Args:
+            file_path: Full path to the file.
+            fileobj: Binary file object to copy from.
+
+        Returns:
+            Number of bytes written.
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = os.open(file_path, flags, 0o644)
+        except FileNotFoundError:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(file_path, flags, 0o644)
+
+        with os.fdopen(fd, "wb") as f:
+            shutil.copyfileobj(fileobj, f, DOWNLOAD_CHUNK_SIZE)
+            return f.tell()
 
     async def upload(
         self,
@@ -66,22 +112,40 @@ class LocalStorageProvider(StorageProvider):
         Returns:
             StorageFile with file information.
 
+        Raises:
+            StorageError: If upload fails.
+        """
+        return await self.upload_stream(key, io.BytesIO(data), content_type)
+
+    async def upload_stream(
+        self,
+        key: str,
+        fileobj: BinaryIO,
+        content_type: str = "application/octet-stream",
+    ) -> StorageFile:
+        """Upload a file to local storage from a file-like object.
+
+        Args:
+            key: Unique identifier/path for the file.
+            fileobj: Binary file object to copy from.
+            content_type: MIME type of the file.
+
+        Returns:
+            StorageFile with file information.
+
         Raises:
             StorageError: If upload fails.
         """
         try:
             file_path = self._get_file_path(key)
 
-            # Ensure parent directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write file
-            file_path.write_bytes(data)
+            # Write in a worker thread so large files don't block the event loop
+            size = await asyncio.to_thread(self._write_file, file_path, fileobj)
 
             return StorageFile(
                 key=key,
                 url=f"{self._base_url}/{key}",
-                size=len(data),
+                size=size,
                 content_type=content_type,
             )
 
@@ -103,14 +167,48 @@ class LocalStorageProvider(StorageProvider):
         """
         file_path = self._get_file_path(key)
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {key}")
+        try:
+            return await asyncio.to_thread(file_path.read_bytes)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {key}") from None
+        except Exception as e:
+            raise StorageError(f"Failed to download file: {e}") from e
+
+    async def download_stream(
+        self,
+        key: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Download a file from local storage in chunks.
+
+        Args:
+            key: Unique identifier/path for the file.
+            chunk_size: Maximum size of each chunk in bytes.
+
+        Yields:
+            File content in chunks.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            StorageError: If download fails.
+        """
+        file_path = self._get_file_path(key)
 
         try:
-            return file_path.read_bytes()
+            file = await asyncio.to_thread(file_path.open, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {key}") from None
         except Exception as e:
             raise StorageError(f"Failed to download file: {e}") from e
 
+        try:
+            while chunk := await asyncio.to_thread(file.read, chunk_size):
+                yield chunk
+        except OSError as e:
+            raise StorageError(f"Failed to download file: {e}") from e
+        finally:
+            file.close()
+
     async def delete(self, key: str) -> bool:
         """Delete a file from local storage.
 
@@ -125,12 +223,11 @@ class LocalStorageProvider(StorageProvider):
         """
         file_path = self._get_file_path(key)
 
-        if not file_path.exists():
-            return False
-
         try:
-            os.remove(file_path)
+            await asyncio.to_thread(os.remove, file_path)
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             raise StorageError(f"Failed to delete file: {e}") from e
 
@@ -138,7 +235,8 @@ class LocalStorageProvider(StorageProvider):
         """Get URL for a file.
 
         Note: Local storage does not support signed URLs,
-        so expires_in is ignored.
+        so expires_in is ignored. The file is not checked for
+        existence; the file server responds 404 for missing files.
 
         Args:
             key: Unique identifier/path for the file.
@@ -146,15 +244,8 @@ class LocalStorageProvider(StorageProvider):
 
         Returns:
             URL to access the file.
-
-        Raises:
-            FileNotFoundError: If file does not exist.
         """
-        file_path = self._get_file_path(key)
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {key}")
-
+        self._get_file_path(key)  # Validate the key
         return f"{self._base_url}/{key}"
 
     async def exists(self, key: str) -> bool:
@@ -4,15 +4,40 @@ This module provides file storage using AWS S3.
 Requires the 'aws' optional dependencies to be installed.
 """
 
-from typing import TYPE_CHECKING
-
-from src.adapters.storage.base import StorageError, StorageFile, StorageProvider
+import asyncio
+import io
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar
+
+from src.adapters.storage.base import (
+    DOWNLOAD_CHUNK_SIZE,
+    StorageError,
+    StorageFile,
+    StorageProvider,
+)
 from src.config import get_settings
+from src.core.cache import TTLCache
 from src.core.logging import logger
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
 
+# Uploads at or above this size are sent as parallel multipart parts
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CONCURRENCY = 10
+
+# Upper bound on S3 calls in flight per process; the client's connection
+# pool matches it so no worker thread queues for a connection
+IO_WORKERS = 64
+
+# Presigned URLs are reused for 1/URL_CACHE_FRACTION of their lifetime
+URL_CACHE_FRACTION = 10
+URL_CACHE_SIZE = 10_000
+
+T = TypeVar("T")
+
 
 class S3StorageProvider(StorageProvider):
     """AWS S3 storage provider.
@@ -23,8 +48,20 @@ class S3StorageProvider(StorageProvider):
         _client: Boto3 S3 client.
         _bucket: S3 bucket name.
         _region: AWS region.
+        _transfer_config: Multipart settings for large uploads.
+        _executor: Dedicated thread pool for blocking boto3 calls.
+        _url_cache: Presigned URLs keyed by (key, expires_in).
     """
 
+    __slots__ = (
+        "_client",
+        "_bucket",
+        "_region",
+        "_transfer_config",
+        "_executor",
+        "_url_cache",
+    )
+
     def __init__(self) -> None:
         """Initialize S3 storage provider.
 
@@ -34,6 +71,8 @@ class S3StorageProvider(StorageProvider):
         """
         try:
             import boto3
+            from boto3.s3.transfer import TransferConfig
+            from botocore.config import Config
         except ImportError as e:
             raise ImportError(
                 "boto3 is required for S3 storage. "
@@ -45,12 +84,53 @@ class S3StorageProvider(StorageProvider):
         if not settings.aws_s3_bucket:
             raise ValueError("AWS_S3_BUCKET is required")
 
-        self._client: S3Client = boto3.client(
+        session = boto3.session.Session()
+        self._client: S3Client = session.client(
             "s3",
             region_name=settings.aws_region,
+            config=Config(
+                max_pool_connections=IO_WORKERS,
+                retries={"max_attempts": 5, "mode": "adaptive"},
+                tcp_keepalive=True,
+            ),
         )
         self._bucket = settings.aws_s3_bucket
         self._region = settings.aws_region
+        self._transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_THRESHOLD,
+            max_concurrency=MULTIPART_CONCURRENCY,
+            use_threads=True,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=IO_WORKERS,
+            thread_name_prefix="s3",
+        )
+        # Entries get a TTL derived from each URL's own expiry
+        self._url_cache: TTLCache[tuple[str, int], str] = TTLCache(
+            maxsize=URL_CACHE_SIZE,
+            ttl=0,
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking boto3 call on the provider's thread pool.
+
+        Using a dedicated pool keeps S3 traffic from exhausting the
+        event loop's default executor used elsewhere in the app.
+
+        Args:
+            func: Blocking callable.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            The callable's return value.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(func, *args, **kwargs),
+        )
 
     async def upload(
         self,
@@ -60,6 +140,10 @@ class S3StorageProvider(StorageProvider):
     ) -> StorageFile:
         """Upload a file to S3.
 
+        Small files are sent with a single PUT; files of at least
+        MULTIPART_THRESHOLD bytes are uploaded as parallel multipart parts,
+        so a failed part is retried on its own.
+
         Args:
             key: Unique identifier/path for the file.
             data: File content as bytes.
@@ -71,8 +155,12 @@ class S3StorageProvider(StorageProvider):
         Raises:
             StorageError: If upload fails.
         """
+        if len(data) >= MULTIPART_THRESHOLD:
+            return await self.upload_stream(key, io.BytesIO(data), content_type)
+
         try:
-            self._client.put_object(
+            await self._run(
+                self._client.put_object,
                 Bucket=self._bucket,
                 Key=key,
                 Body=data,
@@ -92,6 +180,80 @@ class S3StorageProvider(StorageProvider):
             logger.exception("S3 upload error", error=str(e))
             raise StorageError(f"Failed to upload file: {e}") from e
 
+    def _upload_fileobj(self, key: str, fileobj: BinaryIO, content_type: str) -> int:
+        """Upload a stream with the multipart transfer manager.
+
+        Args:
+            key: Unique identifier/path for the file.
+            fileobj: Binary file object to read from.
+            content_type: MIME type of the file.
+
+        Returns:
+            Number of bytes uploaded.
+        """
+        # Parts report progress from several threads; list.append is atomic.
+        # Amounts are negative when a failed part is rewound for a retry.
+        transferred: list[int] = []
+        self._client.upload_fileobj(
+            fileobj,
+            self._bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Callback=transferred.append,
+            Config=self._transfer_config,
+        )
+        return sum(transferred)
+
+    async def upload_stream(
+        self,
+        key: str,
+        fileobj: BinaryIO,
+        content_type: str = "application/octet-stream",
+    ) -> StorageFile:
+        """Upload a file to S3 from a file-like object.
+
+        The stream is sent in MULTIPART_THRESHOLD-sized parts, so memory
+        use stays bounded by the part size and concurrency.
+
+        Args:
+            key: Unique identifier/path for the file.
+            fileobj: Binary file object to read from.
+            content_type: MIME type of the file.
+
+        Returns:
+            StorageFile with file information.
+
+        Raises:
+            StorageError: If upload fails.
+        """
+        try:
+            size = await self._run(self._upload_fileobj, key, fileobj, content_type)
+
+            url = f"https://{self._bucket}.s3.{self._region}.amazonaws.com/{key}"
+
+            return StorageFile(
+                key=key,
+                url=url,
+                size=size,
+                content_type=content_type,
+            )
+
+        except Exception as e:
+            logger.exception("S3 upload error", error=str(e))
+            raise StorageError(f"Failed to upload file: {e}") from e
+
+    def _read_object(self, key: str) -> bytes:
+        """Fetch an object and read its whole body.
+
+        Args:
+            key: Unique identifier/path for the file.
+
+        Returns:
+            File content as bytes.
+        """
+        response = self._client.get_object(Bucket=self._bucket, Key=key)
+        return response["Body"].read()
+
     async def download(self, key: str) -> bytes:
         """Download a file from S3.
 
@@ -106,36 +268,73 @@ class S3StorageProvider(StorageProvider):
             StorageError: If download fails.
         """
         try:
-            response = self._client.get_object(
+            # Read the body in the same thread so the socket read doesn't block
+            return await self._run(self._read_object, key)
+
+        except self._client.exceptions.NoSuchKey as e:
+            raise FileNotFoundError(f"File not found: {key}") from e
+        except Exception as e:
+            logger.exception("S3 download error", error=str(e))
+            raise StorageError(f"Failed to download file: {e}") from e
+
+    async def download_stream(
+        self,
+        key: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Download a file from S3 in chunks.
+
+        Args:
+            key: Unique identifier/path for the file.
+            chunk_size: Maximum size of each chunk in bytes.
+
+        Yields:
+            File content in chunks.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            StorageError: If download fails.
+        """
+        try:
+            response = await self._run(
+                self._client.get_object,
                 Bucket=self._bucket,
                 Key=key,
             )
-            return response["Body"].read()
+        except self._client.exceptions.NoSuchKey as e:
+            raise FileNotFoundError(f"File not found: {key}") from e
+        except Exception as e:
+            logger.exception("S3 download error", error=str(e))
+            raise StorageError(f"Failed to download file: {e}") from e
 
-        except self._client.exceptions.NoSuchKey:
-            raise FileNotFoundError(f"File not found: {key}")
+        body = response["Body"]
+        try:
+            while chunk := await self._run(body.read, chunk_size):
+                yield chunk
         except Exception as e:
             logger.exception("S3 download error", error=str(e))
             raise StorageError(f"Failed to download file: {e}") from e
+        finally:
+            body.close()
 
     async def delete(self, key: str) -> bool:
         """Delete a file from S3.
 
+        S3 deletes are idempotent, so the object is not probed first
+        and missing keys are reported as deleted.
+
         Args:
             key: Unique identifier/path for the file.
 
         Returns:
-            True if file was deleted, False if file not found.
+            Always True.
 
         Raises:
             StorageError: If deletion fails.
         """
         try:
-            # Check if file exists first
-            if not await self.exists(key):
-                return False
-
-            self._client.delete_object(
+            await self._run(
+                self._client.delete_object,
                 Bucket=self._bucket,
                 Key=key,
             )
@@ -148,6 +347,9 @@ class S3StorageProvider(StorageProvider):
     async def get_url(self, key: str, expires_in: int = 3600) -> str:
         """Get a presigned URL for a file.
 
+        URLs are cached and reused for a tenth of their lifetime, so
+        repeated requests for a hot key skip re-signing.
+
         Args:
             key: Unique identifier/path for the file.
             expires_in: URL expiration time in seconds.
@@ -156,11 +358,14 @@ class S3StorageProvider(StorageProvider):
             Presigned URL to access the file.
 
         Raises:
-            FileNotFoundError: If file does not exist.
+            StorageError: If the URL cannot be generated.
         """
-        if not await self.exists(key):
-            raise FileNotFoundError(f"File not found: {key}")
+        cache_key = (key, expires_in)
+        cached_url = self._url_cache.get(cache_key)
+        if cached_url is not None:
+            return cached_url
 
+        # Signing is local; a missing object surfaces as a 404 when fetched
         try:
             url = self._client.generate_presigned_url(
                 "get_object",
@@ -170,6 +375,12 @@ class S3StorageProvider(StorageProvider):
                 },
                 ExpiresIn=expires_in,
             )
+            # Keep most of the validity window for whoever receives the URL
+            self._url_cache.set(
+                cache_key,
+                url,
+                ttl=expires_in // URL_CACHE_FRACTION,
+            )
             return url
 
         except Exception as e:
@@ -186,7 +397,8 @@ class S3StorageProvider(StorageProvider):
             True if file exists, False otherwise.
         """
         try:
-            self._client.head_object(
+            await self._run(
+                self._client.head_object,
                 Bucket=self._bucket,
                 Key=key,
             )
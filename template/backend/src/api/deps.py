@@ -3,20 +3,71 @@
 This module provides common dependencies for API endpoints.
 """
 
+import hashlib
+import time
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import Executable, func, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.auth import AuthProvider, AuthUser, get_auth_provider
+from src.core.cache import TTLCache
 from src.db.session import get_db
 from src.models.user import User
 
 # Security scheme
 security = HTTPBearer()
 
+# Bursts of requests with the same token skip provider verification and
+# the user lookup. Revocations at the auth provider (e.g. a deleted provider
+# user) take effect once the entry expires; tokens are never cached past
+# their own expiry. Deleting a user evicts their entries (forget_user).
+AUTH_CACHE_TTL = 30
+AUTH_CACHE_SIZE = 10_000
+_token_cache: TTLCache[bytes, AuthUser] = TTLCache(AUTH_CACHE_SIZE, AUTH_CACHE_TTL)
+_user_id_cache: TTLCache[AuthUser, int] = TTLCache(AUTH_CACHE_SIZE, AUTH_CACHE_TTL)
+
+
+def _is_same_user(user: User, auth_user: AuthUser) -> bool:
+    """Check that a database user belongs to an authenticated user.
+
+    Args:
+        user: User model from database.
+        auth_user: Authenticated user from token.
+
+    Returns:
+        True if the external ID or email matches.
+    """
+    if auth_user.external_id is not None and user.external_id == auth_user.external_id:
+        return True
+    return user.email.lower() == auth_user.email.lower()
+
+
+def forget_user(user_id: int, email: str, external_id: str | None) -> None:
+    """Evict a deleted user's cached tokens and user ID.
+
+    Only this worker's caches are cleared; other workers re-read the
+    user row on every request, so they stop serving it too.
+
+    Args:
+        user_id: Deleted user's database ID.
+        email: Deleted user's email.
+        external_id: Deleted user's external ID, if any.
+    """
+    email = email.lower()
+
+    def belongs(auth_user: AuthUser) -> bool:
+        if external_id is not None and auth_user.external_id == external_id:
+            return True
+        return auth_user.email.lower() == email
+
+    _token_cache.pop_where(lambda _, auth_user: belongs(auth_user))
+    _user_id_cache.pop_where(
+        lambda auth_user, cached_id: cached_id == user_id or belongs(auth_user)
+    )
+
 
 async def get_current_auth_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
@@ -34,6 +85,11 @@ async def get_current_auth_user(
     Raises:
         HTTPException: If authentication fails.
     """
+    cache_key = hashlib.sha256(credentials.credentials.encode()).digest()
+    auth_user = _token_cache.get(cache_key)
+    if auth_user is not None:
+        return auth_user
+
     auth_user = await auth.verify_token(credentials.credentials)
 
     if not auth_user:
@@ -43,6 +99,10 @@ async def get_current_auth_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    ttl: float = AUTH_CACHE_TTL
+    if auth_user.expires_at is not None:
+        ttl = min(ttl, auth_user.expires_at - time.time())
+    _token_cache.set(cache_key, auth_user, ttl=ttl)
     return auth_user
 
 
@@ -62,12 +122,36 @@ async def get_current_user(
     Raises:
         HTTPException: If user not found in database.
     """
-    # Try to find user by external_id first, then by email
-    stmt = select(User).where(
-        (User.external_id == auth_user.external_id) | (User.email == auth_user.email)
-    )
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    # Recently resolved users are fetched by primary key; the match check
+    # guards against stale IDs (e.g. a deleted and re-created user)
+    user = None
+    user_id = _user_id_cache.get(auth_user)
+    if user_id is not None:
+        user = await db.get(User, user_id)
+
+    if user is None or not _is_same_user(user, auth_user):
+        # Try to find user by external_id first, then by email.
+        # Each branch is a lookup on its own unique index (ix_users_external_id,
+        # ix_users_email_lower); UNION ALL keeps them independent index scans on any
+        # planner, and ordering by a literal priority makes an external_id
+        # match win over an email match on another row. Comparing to a None
+        # external_id would render "IS NULL" and match every locally
+        # registered user, so that branch is only added when set.
+        email_matches = func.lower(User.email) == func.lower(auth_user.email)
+        lookup: Executable = select(User).where(email_matches)
+        if auth_user.external_id is not None:
+            by_external_id = select(User, literal(0).label("priority")).where(
+                User.external_id == auth_user.external_id
+            )
+            by_email = select(User, literal(1).label("priority")).where(email_matches)
+            lookup = select(User).from_statement(
+                union_all(by_external_id, by_email).order_by("priority").limit(1)
+            )
+        result = await db.execute(lookup)
+        user = result.scalar_one_or_none()
+
+        if user:
+            _user_id_cache.set(auth_user, user.id)
 
     if not user:
         raise HTTPException(
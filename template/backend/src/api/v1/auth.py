@@ -4,7 +4,8 @@ This module provides authentication-related API endpoints.
 """
 
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert
 
 from src.adapters.auth.base import AuthenticationError, UserExistsError
 from src.adapters.auth.mock import MockAuthProvider
@@ -16,6 +17,11 @@ from src.schemas.user import LoginRequest, Token, UserCreate, UserResponse
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Built once; SQLAlchemy and asyncpg reuse the compiled/prepared form
+_USER_BY_EMAIL = select(User).where(
+    func.lower(User.email) == func.lower(bindparam("email"))
+)
+
 
 @router.post("/login", response_model=Token)
 async def login(
@@ -54,21 +60,20 @@ async def login(
         )
 
     # Ensure user exists in database
-    stmt = select(User).where(User.email == auth_user.email)
-    result = await db.execute(stmt)
+    result = await db.execute(_USER_BY_EMAIL, {"email": auth_user.email})
     user = result.scalar_one_or_none()
 
     if not user:
-        # Create user in database if not exists
-        async with db.begin():
-            user = User(
-                email=auth_user.email,
-                name=auth_user.name,
-                external_id=auth_user.external_id,
-                is_active=True,
-            )
-            db.add(user)
-            await db.flush()
+        # Create user in database if not exists; the lookup above has
+        # already begun the session's transaction
+        user = User(
+            email=auth_user.email,
+            name=auth_user.name,
+            external_id=auth_user.external_id,
+            is_active=True,
+        )
+        db.add(user)
+        await db.commit()
         logger.info("Created new user from auth", user_id=user.id, email=user.email)
 
     if not user.is_active:
@@ -108,12 +113,29 @@ async def register(
     Raises:
         HTTPException: If registration fails.
     """
-    # Check if user already exists in database
-    stmt = select(User).where(User.email == request.email)
+    # Hash before opening the transaction so no connection waits on it
+    hashed_password = await get_password_hash(request.password)
+
+    # Claim the email in the database before touching the auth provider,
+    # so a duplicate costs no provider calls. The unique email index
+    # settles races: a concurrent registration for the same email waits on
+    # this uncommitted row and then conflicts.
+    stmt = (
+        insert(User)
+        .values(
+            email=request.email,
+            name=request.name,
+            hashed_password=hashed_password,
+            is_active=True,
+        )
+        .on_conflict_do_nothing(index_elements=[func.lower(User.email)])
+        .returning(User)
+    )
     result = await db.execute(stmt)
-    existing_user = result.scalar_one_or_none()
+    user = result.scalar_one_or_none()
 
-    if existing_user:
+    if user is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email already exists",
@@ -126,34 +148,42 @@ async def register(
             password=request.password,
             name=request.name,
         )
-
-        # Create user in database
-        async with db.begin():
-            user = User(
-                email=auth_user.email,
-                name=auth_user.name,
-                hashed_password=get_password_hash(request.password),
-                external_id=auth_user.external_id,
-                is_active=True,
-            )
-            db.add(user)
-            await db.flush()
-
-        logger.info("User registered", user_id=user.id, email=user.email)
-
-        return user
-
-    except UserExistsError:
+    except UserExistsError as e:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email already exists",
-        )
+        ) from e
     except Exception as e:
+        await db.rollback()
         logger.exception("Registration failed", email=request.email, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Registration failed",
-        )
+        ) from e
+
+    user.external_id = auth_user.external_id
+    try:
+        await db.commit()
+    except Exception as e:
+        logger.exception("Registration failed", email=request.email, error=str(e))
+        # Undo the provider side so the email can be registered again
+        try:
+            await auth.delete_user(auth_user.email)
+        except Exception as delete_error:
+            logger.exception(
+                "Auth provider user left without a database row",
+                email=auth_user.email,
+                error=str(delete_error),
+            )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Registration failed",
+        ) from e
+
+    logger.info("User registered", user_id=user.id, email=user.email)
+
+    return user
 
 
 @router.post("/logout")
@@ -3,10 +3,15 @@
 This module provides user-related API endpoints.
 """
 
+from typing import Any
+
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.api.deps import CurrentUser, CurrentSuperuser, DBSession
+from src.api.deps import CurrentUser, CurrentSuperuser, DBSession, forget_user
 from src.core.logging import logger
 from src.core.security import get_password_hash
 from src.models.user import User
@@ -14,6 +19,21 @@ from src.schemas.user import UserResponse, UserUpdate
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Other users, for the email uniqueness check inside UPDATE statements
+_OtherUser = aliased(User)
+
+
+def _set_committed(user: User, field: str, value: Any) -> None:
+    """Set an attribute as if it had been loaded from the database.
+
+    Args:
+        user: User to modify.
+        field: Attribute name.
+        value: Value now stored in the row.
+    """
+    # SQLAlchemy before 2.1 ships set_committed_value without annotations
+    set_committed_value(user, field, value)  # type: ignore[no-untyped-call,unused-ignore]
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
@@ -45,32 +65,61 @@ async def update_current_user(
 
     Returns:
         Updated user information.
+
+    Raises:
+        HTTPException: If the new email is already in use.
     """
-    # Check if email is already taken (before transaction)
-    if update_data.email is not None:
-        stmt = select(User).where(
-            User.email == update_data.email,
-            User.id != current_user.id,
+    # Only fields that actually change are written
+    changes: dict[str, Any] = {}
+    if update_data.name is not None and update_data.name != current_user.name:
+        changes["name"] = update_data.name
+    if update_data.email is not None and update_data.email != current_user.email:
+        changes["email"] = update_data.email
+
+    # Verifying costs as much as hashing, so a submitted password is always
+    # re-hashed; do it before opening the transaction so no connection waits
+    if update_data.password is not None:
+        changes["hashed_password"] = await get_password_hash(update_data.password)
+
+    if not changes:
+        return current_user
+
+    # One statement checks email uniqueness and applies the update
+    stmt = (
+        update(User)
+        .where(User.id == current_user.id)
+        .values(**changes)
+        .returning(User.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    if "email" in changes:
+        email_taken = select(_OtherUser.id).where(
+            func.lower(_OtherUser.email) == func.lower(changes["email"]),
+            _OtherUser.id != current_user.id,
         )
-        result = await db.execute(stmt)
-        if result.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already in use",
-            )
-
-    # Update allowed fields within transaction
-    async with db.begin():
-        if update_data.name is not None:
-            current_user.name = update_data.name
+        stmt = stmt.where(~email_taken.exists())
 
-        if update_data.email is not None:
-            current_user.email = update_data.email
+    # get_current_user has already begun the session's transaction. A
+    # concurrent update to the same email passes the check too; the unique
+    # index then rejects one of them.
+    try:
+        result = await db.execute(stmt)
+        updated_at = result.scalar_one_or_none()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        updated_at = None
 
-        if update_data.password is not None:
-            current_user.hashed_password = get_password_hash(update_data.password)
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already in use",
+        )
 
-        await db.flush()
+    # Mirror the written values without re-querying the row
+    for field, value in changes.items():
+        _set_committed(current_user, field, value)
+    _set_committed(current_user, "updated_at", updated_at)
 
     logger.info("User updated", user_id=current_user.id)
 
@@ -96,9 +145,8 @@ async def get_user(
     Raises:
         HTTPException: If user not found.
     """
-    stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    # Primary-key lookup: served from the identity map when already loaded
+    user = await db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -154,17 +202,22 @@ async def delete_user(
             detail="Cannot delete yourself",
         )
 
-    stmt = select(User).where(User.id == user_id)
+    # Single round-trip: no row returned means the user did not exist.
+    # CurrentSuperuser has already begun the session's transaction.
+    stmt = (
+        delete(User).where(User.id == user_id).returning(User.email, User.external_id)
+    )
     result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    deleted = result.one_or_none()
+    await db.commit()
 
-    if not user:
+    if deleted is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    async with db.begin():
-        await db.delete(user)
+    # Stop serving the deleted user from the authentication caches
+    forget_user(user_id, deleted.email, deleted.external_id)
 
     logger.info("User deleted", user_id=user_id, deleted_by=current_user.id)
@@ -4,7 +4,7 @@ This module provides configuration management using Pydantic Settings.
 Configuration values are loaded from environment variables.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -18,6 +18,13 @@ class Settings(BaseSettings):
         version: The version of the application.
         debug: Whether debug mode is enabled.
         database_url: The database connection URL.
+        db_pool_size: Connections kept open in the pool per process.
+        db_max_overflow: Extra connections allowed above db_pool_size.
+        db_pool_timeout: Seconds to wait for a free connection.
+        db_pool_recycle: Seconds after which connections are replaced.
+        db_pool_pre_ping: Whether to test connections on checkout.
+        db_statement_cache_size: Prepared statements cached per connection
+            (0 behind PgBouncer transaction pooling).
         secret_key: Secret key for JWT signing.
         auth_provider: The authentication provider to use.
         storage_provider: The storage provider to use.
@@ -44,6 +51,12 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = False
+    db_statement_cache_size: int = 1024
 
     # Security
     secret_key: str
@@ -79,10 +92,12 @@ class Settings(BaseSettings):
 {%- endif %}
 {%- endif %}
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins from comma-separated string.
 
+        Parsed on first access and reused afterwards.
+
         Returns:
             List of allowed CORS origins.
         """
@@ -0,0 +1,115 @@
+"""In-process caching utilities.
+
+This module provides a small bounded TTL cache for memoizing
+expensive lookups within a single worker process.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-memory cache whose entries expire after a TTL.
+
+    When the cache is full, the oldest entry is evicted first.
+    Not thread-safe; intended to be used from the event loop only.
+
+    Attributes:
+        _maxsize: Maximum number of entries kept.
+        _ttl: Default time-to-live in seconds.
+        _data: Cached values with their monotonic deadlines.
+
+    Example:
+        ```python
+        cache: TTLCache[str, AuthUser] = TTLCache(maxsize=1000, ttl=60)
+        cache.set(token, auth_user)
+        auth_user = cache.get(token)  # None once expired
+        ```
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Default time-to-live in seconds.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Get a cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        value, deadline = entry
+        if deadline <= time.monotonic():
+            del self._data[key]
+            return None
+
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl: Time-to-live in seconds. Defaults to the cache TTL.
+                Non-positive values skip caching.
+        """
+        if ttl is None:
+            ttl = self._ttl
+        if ttl <= 0:
+            return
+
+        self._data[key] = (value, time.monotonic() + ttl)
+        self._data.move_to_end(key)
+
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Remove a value if present.
+
+        Args:
+            key: Cache key.
+        """
+        self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[K, V], bool]) -> None:
+        """Remove every value for which predicate returns True.
+
+        Scans all entries, so keep it off hot paths.
+
+        Args:
+            predicate: Called with each key and value.
+        """
+        for key in [k for k, (v, _) in self._data.items() if predicate(k, v)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones.
+
+        Returns:
+            Number of entries.
+        """
+        return len(self._data)
@@ -8,12 +8,26 @@ import logging
 import sys
 from typing import Any
 
+import orjson
 import structlog
-from structlog.types import Processor
+from structlog.types import FilteringBoundLogger, Processor
 
 from src.config import get_settings
 
 
+def _orjson_dumps_str(obj: Any, **kwargs: Any) -> str:
+    """Serialize with orjson for renderers that must return text.
+
+    Args:
+        obj: Object to serialize.
+        **kwargs: Options forwarded by structlog (e.g. ``default``).
+
+    Returns:
+        The JSON document as a string.
+    """
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 def setup_logging() -> None:
     """Configure structured logging based on settings.
 
@@ -21,6 +35,7 @@ def setup_logging() -> None:
     based on the LOG_HANDLER configuration.
     """
     settings = get_settings()
+    log_level = getattr(logging, settings.log_level)
 
     # Common processors for all handlers
     shared_processors: list[Processor] = [
@@ -35,22 +50,41 @@ def setup_logging() -> None:
 
     # Development: pretty console output
     # Production: JSON output
+    # Both drop events below the log level before any processor runs
     if settings.debug:
         renderer: Processor = structlog.dev.ConsoleRenderer(colors=True)
-    else:
-        renderer = structlog.processors.JSONRenderer()
 
-    structlog.configure(
-        processors=[
-            *shared_processors,
-            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ],
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=True,
-    )
-
-    # Configure standard library logging
+        # Route structlog through the stdlib handler so all output is pretty
+        structlog.configure(
+            processors=[
+                *shared_processors,
+                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+            ],
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
+            cache_logger_on_first_use=True,
+        )
+    else:
+        # The stdlib handler writes text, so this renderer returns str
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps_str)
+
+        # Skip the stdlib bridge: each event runs through one processor
+        # chain and is written to stdout as JSON bytes
+        structlog.configure(
+            processors=[
+                structlog.contextvars.merge_contextvars,
+                structlog.processors.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso", utc=True),
+                structlog.processors.StackInfoRenderer(),
+                structlog.processors.format_exc_info,
+                structlog.processors.JSONRenderer(serializer=orjson.dumps),
+            ],
+            logger_factory=structlog.BytesLoggerFactory(),
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
+            cache_logger_on_first_use=True,
+        )
+
+    # Configure standard library logging (uvicorn and third-party loggers)
     formatter = structlog.stdlib.ProcessorFormatter(
         foreign_pre_chain=shared_processors,
         processors=[
@@ -62,9 +96,6 @@ def setup_logging() -> None:
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
 
-    # Set log level
-    log_level = getattr(logging, settings.log_level)
-
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
@@ -77,11 +108,16 @@ def setup_logging() -> None:
         uvicorn_logger.handlers.clear()
         uvicorn_logger.addHandler(handler)
         uvicorn_logger.setLevel(log_level)
+        # Each logger has the handler; propagating would repeat the record
+        uvicorn_logger.propagate = False
 
 
-def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str | None = None) -> FilteringBoundLogger:
     """Get a structured logger instance.
 
+    Calls below the configured log level return immediately, so hot
+    paths pay almost nothing for filtered-out messages.
+
     Args:
         name: Logger name. If None, uses the caller's module name.
 
@@ -0,0 +1,98 @@
+"""ASGI middleware.
+
+This module provides middleware that applies backpressure to
+database-bound requests.
+"""
+
+import asyncio
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ConcurrencyLimitMiddleware:
+    """Limit the number of in-flight requests under a path prefix.
+
+    Async servers accept connections without backpressure, so a burst of
+    requests otherwise piles up on the database pool and fails with pool
+    checkout timeouts. Requests beyond the limit wait here instead; those
+    that cannot start within queue_timeout get 503 with Retry-After.
+
+    Written as plain ASGI rather than BaseHTTPMiddleware so streamed
+    responses are passed through untouched.
+
+    Attributes:
+        _app: The wrapped ASGI application.
+        _path_prefix: Only HTTP requests under this prefix are limited.
+        _queue_timeout: Seconds a request may wait for a slot.
+        _retry_after: Value of the Retry-After header on rejection.
+        _semaphore: Slots for concurrently running requests.
+
+    Example:
+        ```python
+        app.add_middleware(
+            ConcurrencyLimitMiddleware,
+            limit=settings.db_pool_size + settings.db_max_overflow,
+        )
+        ```
+    """
+
+    __slots__ = (
+        "_app",
+        "_path_prefix",
+        "_queue_timeout",
+        "_retry_after",
+        "_semaphore",
+    )
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limit: int,
+        path_prefix: str = "/api",
+        queue_timeout: float = 30,
+        retry_after: int = 1,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            limit: Maximum number of requests running at once.
+            path_prefix: Only HTTP requests under this prefix are limited.
+            queue_timeout: Seconds a request may wait for a slot.
+            retry_after: Value of the Retry-After header on rejection.
+        """
+        self._app = app
+        self._path_prefix = path_prefix
+        self._queue_timeout = queue_timeout
+        self._retry_after = retry_after
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http" or not scope["path"].startswith(self._path_prefix):
+            await self._app(scope, receive, send)
+            return
+
+        try:
+            async with asyncio.timeout(self._queue_timeout):
+                await self._semaphore.acquire()
+        except TimeoutError:
+            response = ORJSONResponse(
+                {"detail": "Server is busy, please retry"},
+                status_code=503,
+                headers={"Retry-After": str(self._retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            self._semaphore.release()
@@ -4,25 +4,40 @@ This module provides security-related utilities including
 password hashing and JWT token handling.
 """
 
-from datetime import UTC, datetime, timedelta
+import asyncio
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 from passlib.context import CryptContext
 
 from src.config import get_settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: new hashes use argon2id (OWASP minimum
+# parameters); existing bcrypt hashes still verify and are deprecated
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
 
 # JWT settings
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash.
 
+    Hashing is CPU-bound, so it runs in a worker thread to keep the
+    event loop responsive.
+
     Args:
         plain_password: The plain text password.
         hashed_password: The hashed password to verify against.
@@ -30,19 +45,31 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if the password matches, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """Hash a password.
 
+    Hashing runs in a worker thread; see verify_password().
+
     Args:
         password: The plain text password to hash.
 
     Returns:
         The hashed password.
     """
-    return pwd_context.hash(password)
+    return await asyncio.to_thread(pwd_context.hash, password)
+
+
+@lru_cache(maxsize=1)
+def _signing_key() -> bytes:
+    """Get the JWT signing key, read from settings once per process.
+
+    Returns:
+        The secret key as bytes.
+    """
+    return get_settings().secret_key.encode()
 
 
 def create_access_token(
@@ -59,17 +86,14 @@ def create_access_token(
     Returns:
         The encoded JWT token.
     """
-    settings = get_settings()
-    to_encode = data.copy()
-
     if expires_delta:
-        expire = datetime.now(UTC) + expires_delta
+        expires_in = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(UTC) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expires_in = ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
-    return encoded_jwt
+    # JWT NumericDate: seconds since the epoch
+    to_encode = {**data, "exp": int(time.time()) + expires_in}
+    return jwt.encode(to_encode, _signing_key(), algorithm=ALGORITHM)
 
 
 def decode_access_token(token: str) -> dict[str, Any] | None:
@@ -81,9 +105,8 @@ def decode_access_token(token: str) -> dict[str, Any] | None:
     Returns:
         The decoded token payload, or None if invalid.
     """
-    settings = get_settings()
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _signing_key(), algorithms=[ALGORITHM])
         return payload
-    except JWTError:
+    except PyJWTError:
         return None
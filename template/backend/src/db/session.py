@@ -3,8 +3,13 @@
 This module provides the database engine and session factory.
 """
 
+import asyncio
+import uuid
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
+from typing import Any
 
+import asyncpg
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.config import get_settings
@@ -17,14 +22,51 @@ database_url = settings.database_url
 if database_url.startswith("postgresql://"):
     database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
 
+
+def _unique_statement_name() -> str:
+    """Name a prepared statement so it never collides with another.
+
+    Returns:
+        A statement name unique across all connections.
+    """
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+# Prepared statements are cached per connection, so hot queries skip the
+# Parse step after first use (asyncpg driver and SQLAlchemy adapter caches).
+# Behind PgBouncer transaction pooling, consecutive transactions may run on
+# different server connections, so the cache must be disabled (size 0) and
+# statement names made unique.
+connect_args: dict[str, Any] = {}
+if database_url.startswith("postgresql+asyncpg://"):
+    connect_args = {
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    }
+    if settings.db_statement_cache_size == 0:
+        connect_args["prepared_statement_name_func"] = _unique_statement_name
+
+# Each process opens up to pool_size + max_overflow connections; keep
+# workers x that total below PostgreSQL's max_connections. Beyond roughly
+# 50 connections per database, throughput stops improving and requests
+# just queue inside PostgreSQL instead of in the pool.
+# Pre-ping costs a round trip per checkout and leaves sessions "idle in
+# transaction" behind PgBouncer's transaction pooling, so it is opt-in and
+# stale connections are handled by pool_recycle instead.
 engine = create_async_engine(
     database_url,
     echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    connect_args=connect_args,
 )
 
+# Connections kept by the raw asyncpg pool used for health checks
+RAW_POOL_SIZE = 2
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -39,7 +81,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get a database session.
 
     This function provides a session without auto-commit.
-    For write operations, use `async with db.begin():` to manage transactions.
+    The session begins a transaction on first use, so write operations
+    run their statements and then call `await db.commit()`.
+
+    FastAPI caches dependencies per request, so every dependency that
+    declares `Depends(get_db)` (e.g. `get_current_user` and the endpoint
+    itself) shares one session and one pooled connection. Keep depending
+    on get_db rather than calling it or `async_session_maker()` directly,
+    and don't pass `use_cache=False`.
 
     Yields:
         An async database session.
@@ -56,10 +105,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         ```python
         @router.post("/users")
         async def create_user(payload: UserCreate, db: AsyncSession = Depends(get_db)):
-            async with db.begin():
-                user = User(**payload.model_dump())
-                db.add(user)
-                await db.flush()
+            user = User(**payload.model_dump())
+            db.add(user)
+            await db.commit()
             return {"id": user.id}
         ```
     """
@@ -69,3 +117,44 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def create_raw_pool() -> asyncpg.Pool | None:
+    """Create a small asyncpg pool that bypasses SQLAlchemy.
+
+    Used for cheap infrastructure queries such as the health check's
+    `SELECT 1`, which would otherwise pay for session construction.
+    Connections are opened lazily, so startup doesn't require the
+    database to be reachable. Business queries keep using get_db.
+
+    Returns:
+        The pool, or None if the database is not PostgreSQL.
+    """
+    if not database_url.startswith("postgresql+asyncpg://"):
+        return None
+    return await asyncpg.create_pool(
+        database_url.replace("postgresql+asyncpg://", "postgresql://", 1),
+        min_size=0,
+        max_size=RAW_POOL_SIZE,
+        statement_cache_size=settings.db_statement_cache_size,
+    )
+
+
+async def warm_pool(size: int) -> None:
+    """Open pooled connections ahead of the first requests.
+
+    The pool connects lazily, so after a deploy the first requests would
+    each pay for TCP, TLS and authentication. Connections are opened
+    concurrently and held together, so the pool establishes `size`
+    distinct ones, then all are returned to it.
+
+    Args:
+        size: Number of connections to open, at most the pool size.
+    """
+    try:
+        async with AsyncExitStack() as stack, asyncio.TaskGroup() as tg:
+            for _ in range(size):
+                tg.create_task(stack.enter_async_context(engine.connect()))
+    except ExceptionGroup as e:
+        # Every connection usually fails the same way; report the first
+        raise e.exceptions[0] from e
@@ -3,23 +3,61 @@
 This module creates and configures the FastAPI application instance.
 """
 
+import asyncio
+from collections.abc import Awaitable
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from src.adapters.auth import get_auth_provider
+from src.adapters.storage import get_storage_provider
 from src.api.router import api_router
 from src.config import get_settings
 from src.core.logging import logger, setup_logging
-from src.db.session import engine
+from src.core.middleware import ConcurrencyLimitMiddleware
+from src.db.session import create_raw_pool, engine, warm_pool
+
+# Seconds the health check waits for the database
+HEALTH_CHECK_TIMEOUT = 5
+
+# Seconds startup waits for each warm-up step
+WARM_UP_TIMEOUT = 10
+
+# Database connections each worker opens at startup; the rest of the pool
+# connects on demand, so restarting many workers doesn't flood the database
+WARM_POOL_CONNECTIONS = 2
+
+
+async def _warm_up[T](name: str, step: Awaitable[T]) -> T | None:
+    """Run a warm-up step, bounded by WARM_UP_TIMEOUT.
+
+    Warm-ups only move work off the first request, so a failure is
+    logged and left for that request to surface.
+
+    Args:
+        name: Step name for the log.
+        step: Awaitable performing the warm-up.
+
+    Returns:
+        The step's result, or None if it failed.
+    """
+    try:
+        async with asyncio.timeout(WARM_UP_TIMEOUT):
+            return await step
+    except Exception as e:
+        logger.warning("Startup warm-up failed", step=name, error=str(e))
+        return None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler.
 
-    Performs startup and shutdown tasks.
+    Performs startup and shutdown tasks. Independent startup steps run
+    concurrently, so startup takes as long as the slowest one.
 
     Args:
         app: The FastAPI application instance.
@@ -28,13 +66,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         None
     """
     # Startup
+    settings = get_settings()
     setup_logging()
     logger.info("Application starting up")
 
+    async with asyncio.TaskGroup() as tg:
+        # Without a raw pool the health check skips the database ping
+        raw_pool = tg.create_task(_warm_up("raw_pool", create_raw_pool()))
+        tg.create_task(
+            _warm_up(
+                "db_pool",
+                warm_pool(min(WARM_POOL_CONNECTIONS, settings.db_pool_size)),
+            )
+        )
+        # Providers hash seed passwords or build boto3 clients on creation
+        tg.create_task(_warm_up("auth_provider", asyncio.to_thread(get_auth_provider)))
+        tg.create_task(
+            _warm_up("storage_provider", asyncio.to_thread(get_storage_provider))
+        )
+    app.state.raw_pool = raw_pool.result()
+
     yield
 
     # Shutdown
     logger.info("Application shutting down")
+    if app.state.raw_pool is not None:
+        await app.state.raw_pool.close()
     await engine.dispose()
 
 
@@ -53,6 +110,15 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+
+    # Queue API requests in the app instead of on the database pool.
+    # Added before CORS so CORS wraps it and 503 responses get CORS headers.
+    app.add_middleware(
+        ConcurrencyLimitMiddleware,
+        limit=settings.db_pool_size + settings.db_max_overflow,
+        queue_timeout=settings.db_pool_timeout,
     )
 
     # Configure CORS
@@ -60,8 +126,10 @@ def create_app() -> FastAPI:
         CORSMiddleware,
         allow_origins=settings.cors_origins_list,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # Explicit lists let preflight checks skip echoing request headers;
+        # extend them when adding routes or custom headers
+        allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type"],
     )
 
     # Include API router
@@ -69,17 +137,39 @@ def create_app() -> FastAPI:
 
     # Health check endpoint
     @app.get("/health")
-    async def health_check() -> dict[str, str]:
+    async def health_check(request: Request, response: Response) -> dict[str, str]:
         """Health check endpoint.
 
+        Pings the database over the raw asyncpg pool when one is
+        configured and responds 503 if it is unreachable.
+
+        Args:
+            request: The incoming request.
+            response: The outgoing response, for setting the status code.
+
         Returns:
             Health status information.
         """
-        return {
+        health = {
             "status": "healthy",
             "version": settings.version,
         }
 
+        raw_pool = getattr(request.app.state, "raw_pool", None)
+        if raw_pool is not None:
+            try:
+                async with asyncio.timeout(HEALTH_CHECK_TIMEOUT):
+                    async with raw_pool.acquire() as conn:
+                        await conn.fetchval("SELECT 1")
+                health["database"] = "connected"
+            except Exception as e:
+                logger.warning("Database health check failed", error=str(e))
+                health["status"] = "unhealthy"
+                health["database"] = "unavailable"
+                response.status_code = 503
+
+        return health
+
     return app
 
 
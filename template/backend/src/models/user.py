@@ -3,7 +3,7 @@
 This module defines the User SQLAlchemy model.
 """
 
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.base import BaseModel
@@ -16,22 +16,35 @@ class User(BaseModel):
 
     Attributes:
         id: Primary key.
-        email: User's email address (unique).
-        hashed_password: Bcrypt hashed password.
+        email: User's email address (unique, case-insensitive).
+        hashed_password: Password hash (argon2id or legacy bcrypt).
         name: User's display name.
         is_active: Whether the user account is active.
         is_superuser: Whether the user has superuser privileges.
-        external_id: External ID from auth provider (e.g., Cognito sub).
+        external_id: External ID from auth provider (e.g., Cognito sub, unique).
         created_at: Timestamp when the user was created.
         updated_at: Timestamp when the user was last updated.
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Emails are unique regardless of case; lookups compare lower(email)
+        # so they can use this index
+        Index("ix_users_email_lower", text("lower(email)"), unique=True),
+        # Serves "most recent users first" listings
+        Index("ix_users_created_at", text("created_at DESC")),
+        # Local users have no external ID; leaving their NULLs out keeps
+        # the index small. Lookups by a given ID imply IS NOT NULL.
+        Index(
+            "ix_users_external_id",
+            "external_id",
+            unique=True,
+            postgresql_where=text("external_id IS NOT NULL"),
+        ),
+    )
 
     email: Mapped[str] = mapped_column(
         String(255),
-        unique=True,
-        index=True,
         nullable=False,
     )
     hashed_password: Mapped[str | None] = mapped_column(
@@ -54,8 +67,6 @@ class User(BaseModel):
     )
     external_id: Mapped[str | None] = mapped_column(
         String(255),
-        unique=True,
-        index=True,
         nullable=True,  # For external auth providers like Cognito
     )
 
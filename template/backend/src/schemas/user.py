@@ -4,8 +4,16 @@ This module defines Pydantic schemas for user-related operations.
 """
 
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints
+
+# Structural check only: one "@", no whitespace and a dot in the domain.
+# Much cheaper than EmailStr's full RFC parsing on the login/register hot
+# path; EmailStr is kept for admin updates, where throughput doesn't matter.
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+Email = Annotated[str, StringConstraints(max_length=255, pattern=EMAIL_PATTERN)]
 
 
 class UserBase(BaseModel):
@@ -16,7 +24,7 @@ class UserBase(BaseModel):
         name: User's display name.
     """
 
-    email: EmailStr
+    email: Email
     name: str
 
 
@@ -78,7 +86,7 @@ class UserInDB(UserResponse):
     Used internally, not exposed via API.
 
     Attributes:
-        hashed_password: Bcrypt hashed password.
+        hashed_password: Password hash (argon2id or legacy bcrypt).
     """
 
     hashed_password: str | None = None
@@ -116,5 +124,5 @@ class LoginRequest(BaseModel):
         password: User's password.
     """
 
-    email: EmailStr
+    email: Email
     password: str
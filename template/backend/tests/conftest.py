@@ -5,14 +5,20 @@ This module provides common fixtures for testing.
 
 import asyncio
 from collections.abc import AsyncGenerator
-from typing import Generator
+from typing import Any, Generator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from passlib.hash import bcrypt
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
+from src.adapters.auth import get_auth_provider
 from src.adapters.auth.mock import MockAuthProvider
+from src.api import deps
 from src.config import Settings, get_settings
+from src.core.logging import setup_logging
 from src.db.base import Base
 from src.db.session import get_db
 from src.main import app
@@ -31,6 +37,23 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def configure_logging() -> None:
+    """Configure logging once, as the app's lifespan would at startup.
+
+    ASGITransport never sends lifespan events, so the test client
+    doesn't run startup and shutdown for each test.
+    """
+    setup_logging()
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_caches() -> None:
+    """Forget tokens and users cached by earlier tests."""
+    deps._token_cache.clear()
+    deps._user_id_cache.clear()
+
+
 @pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """Create test settings."""
@@ -45,12 +68,28 @@ def test_settings() -> Settings:
 
 @pytest.fixture(scope="session")
 async def test_engine(test_settings: Settings):
-    """Create test database engine."""
+    """Create test database engine.
+
+    Every SQLite :memory: connection is a separate empty database, so
+    StaticPool shares a single connection across sessions.
+    """
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
 
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN itself so savepoints nest inside the test transaction
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_transactions(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def emit_begin(conn: Any) -> None:
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -66,74 +105,97 @@ async def test_engine(test_settings: Settings):
 async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session with proper isolation.
 
-    Uses nested transactions (savepoints) to ensure each test
-    runs in isolation and changes are rolled back after each test.
+    The session joins an outer transaction on its connection, and its own
+    transactions become savepoints. Endpoints can commit as usual, and
+    all changes are still rolled back after each test.
     """
-    async_session_maker = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with async_session_maker() as session:
-        # Start a transaction for the test
-        async with session.begin():
-            # Create a nested transaction (savepoint)
-            nested = await session.begin_nested()
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
 
-            yield session
+        yield session
 
-            # Rollback the nested transaction to clean up test data
-            if nested.is_active:
-                await nested.rollback()
+        await session.close()
+        await transaction.rollback()
 
 
-@pytest.fixture
-def mock_auth() -> MockAuthProvider:
-    """Create mock auth provider."""
-    return MockAuthProvider()
+@pytest.fixture(scope="session")
+async def mock_auth() -> MockAuthProvider:
+    """Create the mock auth provider used by the app, with a superuser."""
+    provider = MockAuthProvider()
+    await provider.create_user("admin@example.com", "password", "Admin User")
+    return provider
 
 
-@pytest.fixture
-async def test_user(db_session: AsyncSession) -> User:
-    """Create a test user in the database."""
-    user = User(
-        email="test@example.com",
-        name="Test User",
-        hashed_password="hashed",
+@pytest.fixture(scope="session")
+def password_hash() -> str:
+    """Hash the test password once, with the cheapest bcrypt cost."""
+    return bcrypt.using(rounds=4).hash("password")
+
+
+def _build_user(password_hash: str, *, is_superuser: bool = False) -> User:
+    """Build the regular test user or the superuser the auth fixtures expect."""
+    if is_superuser:
+        email, name = "admin@example.com", "Admin User"
+    else:
+        email, name = "test@example.com", "Test User"
+    return User(
+        email=email,
+        name=name,
+        hashed_password=password_hash,
         is_active=True,
-        is_superuser=False,
+        is_superuser=is_superuser,
     )
-    db_session.add(user)
+
+
+async def _add_users(db_session: AsyncSession, *users: User) -> None:
+    """Insert users with a single flush."""
+    db_session.add_all(users)
+    # flush() loads the generated ids and applies the Python-side timestamp
+    # defaults, so there is nothing left to refresh
     await db_session.flush()
-    await db_session.refresh(user)
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession, password_hash: str) -> User:
+    """Create a test user in the database."""
+    user = _build_user(password_hash)
+    await _add_users(db_session, user)
     return user
 
 
 @pytest.fixture
-async def superuser(db_session: AsyncSession) -> User:
+async def superuser(db_session: AsyncSession, password_hash: str) -> User:
     """Create a superuser in the database."""
-    user = User(
-        email="admin@example.com",
-        name="Admin User",
-        hashed_password="hashed",
-        is_active=True,
-        is_superuser=True,
-    )
-    db_session.add(user)
-    await db_session.flush()
-    await db_session.refresh(user)
+    user = _build_user(password_hash, is_superuser=True)
+    await _add_users(db_session, user)
     return user
 
 
 @pytest.fixture
+async def users_pair(
+    db_session: AsyncSession,
+    password_hash: str,
+) -> tuple[User, User]:
+    """Create a regular user and a superuser with a single flush."""
+    user = _build_user(password_hash)
+    admin = _build_user(password_hash, is_superuser=True)
+    await _add_users(db_session, user, admin)
+    return user, admin
+
+
+@pytest.fixture(scope="session")
 def auth_headers(mock_auth: MockAuthProvider) -> dict[str, str]:
     """Create authorization headers with a valid token."""
     token = mock_auth.create_token("test@example.com")
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def superuser_headers(mock_auth: MockAuthProvider) -> dict[str, str]:
     """Create authorization headers for superuser."""
     token = mock_auth.create_token("admin@example.com")
@@ -144,11 +206,13 @@ def superuser_headers(mock_auth: MockAuthProvider) -> dict[str, str]:
 async def client(
     db_session: AsyncSession,
     test_settings: Settings,
+    mock_auth: MockAuthProvider,
 ) -> AsyncGenerator[AsyncClient, None]:
     """Create a test client."""
     # Override dependencies
     app.dependency_overrides[get_db] = lambda: db_session
     app.dependency_overrides[get_settings] = lambda: test_settings
+    app.dependency_overrides[get_auth_provider] = lambda: mock_auth
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -2,6 +2,11 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.auth.mock import MockAuthProvider
+from src.models.user import User
 
 
 @pytest.mark.asyncio
@@ -69,6 +74,25 @@ async def test_register_success(client: AsyncClient):
     assert "id" in data
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "email",
+    ["newuser", "new user@example.com", "a@b@example.com"],
+)
+async def test_register_invalid_email(client: AsyncClient, email: str):
+    """Test registration with a malformed email."""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "password": "password123",
+            "name": "New User",
+        },
+    )
+
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_register_duplicate_email(client: AsyncClient, test_user):
     """Test registration with duplicate email."""
@@ -85,6 +109,73 @@ async def test_register_duplicate_email(client: AsyncClient, test_user):
     assert "already exists" in response.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_register_duplicate_email_other_case(client: AsyncClient, test_user):
+    """Test that emails differing only in case count as duplicates."""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "Test@Example.com",
+            "password": "password123",
+            "name": "Duplicate User",
+        },
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_register_duplicate_email_skips_provider(
+    client: AsyncClient,
+    test_user,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a duplicate email is rejected before the auth provider is called."""
+
+    async def create_user(*_args, **_kwargs):
+        raise AssertionError("auth provider called for a duplicate email")
+
+    monkeypatch.setattr(MockAuthProvider, "create_user", create_user)
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "password123",
+            "name": "Duplicate User",
+        },
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_register_provider_failure(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a failing auth provider leaves no user row behind."""
+
+    async def create_user(*_args, **_kwargs):
+        raise RuntimeError("provider unavailable")
+
+    monkeypatch.setattr(MockAuthProvider, "create_user", create_user)
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "failing@example.com",
+            "password": "password123",
+            "name": "Failing User",
+        },
+    )
+
+    assert response.status_code == 500
+    count = await db_session.scalar(
+        select(func.count()).where(User.email == "failing@example.com")
+    )
+    assert count == 0
+
+
 @pytest.mark.asyncio
 async def test_logout(client: AsyncClient):
     """Test logout endpoint."""
@@ -0,0 +1,66 @@
+"""TTL cache tests."""
+
+import pytest
+
+from src.core import cache as cache_module
+from src.core.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Replace the cache's monotonic clock with a controllable one."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_value_until_expired(clock: list[float]):
+    """Test that entries expire after their TTL."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=30)
+    cache.set("a", 1)
+
+    clock[0] += 29
+    assert cache.get("a") == 1
+
+    clock[0] += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_set_with_custom_ttl(clock: list[float]):
+    """Test per-entry TTL overrides and non-positive TTLs."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=30)
+    cache.set("short", 1, ttl=5)
+    cache.set("skipped", 2, ttl=0)
+
+    assert cache.get("skipped") is None
+
+    clock[0] += 5
+    assert cache.get("short") is None
+
+
+def test_oldest_entry_is_evicted_when_full(clock: list[float]):
+    """Test that the cache never grows past maxsize."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_pop_where_removes_matching_entries():
+    """Test that pop_where drops only entries matching the predicate."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 1)
+
+    cache.pop_where(lambda _, value: value == 1)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") is None
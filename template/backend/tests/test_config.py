@@ -0,0 +1,43 @@
+"""Configuration tests."""
+
+import pytest
+
+from src.adapters.auth import factory, get_auth_provider
+from src.config import Settings
+from src.core import security
+from src.core.security import create_access_token, decode_access_token
+
+
+def test_hot_paths_skip_settings_lookup(monkeypatch: pytest.MonkeyPatch):
+    """Test that provider lookups and token handling don't re-read settings."""
+    auth = get_auth_provider()
+    token = create_access_token({"sub": "user@example.com"})
+
+    def get_settings() -> Settings:
+        raise AssertionError("settings read on a hot path")
+
+    monkeypatch.setattr(factory, "get_settings", get_settings)
+    monkeypatch.setattr(security, "get_settings", get_settings)
+
+    assert get_auth_provider() is auth
+    payload = decode_access_token(token)
+    assert payload is not None
+    assert payload["sub"] == "user@example.com"
+    assert decode_access_token(create_access_token({"sub": "other@example.com"}))
+
+
+def test_auth_provider_is_shared():
+    """Test that the auth provider is created once and reused."""
+    assert get_auth_provider() is get_auth_provider()
+
+
+def test_cors_origins_are_parsed_once():
+    """Test that CORS origins are split once and reused."""
+    settings = Settings(
+        database_url="sqlite+aiosqlite:///:memory:",
+        secret_key="test-secret-key",
+        cors_origins="http://a.test, http://b.test",
+    )
+
+    assert settings.cors_origins_list == ["http://a.test", "http://b.test"]
+    assert settings.cors_origins_list is settings.cors_origins_list
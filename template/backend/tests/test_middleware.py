@@ -0,0 +1,51 @@
+"""Middleware tests."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.core.middleware import ConcurrencyLimitMiddleware
+
+
+@pytest.fixture
+def limited_app() -> tuple[FastAPI, asyncio.Event]:
+    """Create an app whose API endpoint blocks until released."""
+    release = asyncio.Event()
+    app = FastAPI()
+    app.add_middleware(ConcurrencyLimitMiddleware, limit=1, queue_timeout=0.05)
+
+    @app.get("/api/slow")
+    async def slow() -> dict[str, str]:
+        await release.wait()
+        return {"status": "done"}
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "healthy"}
+
+    return app, release
+
+
+@pytest.mark.asyncio
+async def test_rejects_requests_over_limit(limited_app: tuple[FastAPI, asyncio.Event]):
+    """Test that requests waiting too long for a slot get 503."""
+    app, release = limited_app
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/api/slow"))
+        await asyncio.sleep(0.01)
+
+        response = await client.get("/api/slow")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
+        # Paths outside the prefix are not limited
+        response = await client.get("/health")
+        assert response.status_code == 200
+
+        release.set()
+        response = await first
+        assert response.status_code == 200
+        assert (await client.get("/api/slow")).status_code == 200
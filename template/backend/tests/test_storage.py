@@ -0,0 +1,85 @@
+"""Local storage provider tests."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from src.adapters.storage.local import LocalStorageProvider
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LocalStorageProvider:
+    """Create a local storage provider rooted in a temporary directory."""
+    return LocalStorageProvider(base_path=str(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_upload_and_download(storage: LocalStorageProvider):
+    """Test that uploaded files can be read back."""
+    result = await storage.upload("docs/readme.txt", b"hello", "text/plain")
+
+    assert result.size == 5
+    assert result.url == "http://localhost:8000/files/docs/readme.txt"
+    assert await storage.download("docs/readme.txt") == b"hello"
+    assert await storage.exists("docs/readme.txt")
+
+
+@pytest.mark.asyncio
+async def test_download_stream(storage: LocalStorageProvider):
+    """Test that streamed downloads are split into chunks."""
+    await storage.upload("large.bin", b"x" * 10)
+
+    chunks = [chunk async for chunk in storage.download_stream("large.bin", 4)]
+
+    assert chunks == [b"xxxx", b"xxxx", b"xx"]
+
+    with pytest.raises(FileNotFoundError):
+        [chunk async for chunk in storage.download_stream("missing.bin")]
+
+
+@pytest.mark.asyncio
+async def test_delete(storage: LocalStorageProvider):
+    """Test deleting existing and missing files."""
+    await storage.upload("file.bin", b"data")
+
+    assert await storage.delete("file.bin") is True
+    assert await storage.delete("file.bin") is False
+
+    with pytest.raises(FileNotFoundError):
+        await storage.download("file.bin")
+
+
+@pytest.mark.parametrize("key", ["../secret", "a/../../secret", "a/.."])
+def test_rejects_directory_traversal(storage: LocalStorageProvider, key: str):
+    """Test that keys escaping the base directory are rejected."""
+    with pytest.raises(ValueError):
+        storage._get_file_path(key)
+
+
+def test_allows_dots_in_file_names(
+    storage: LocalStorageProvider,
+    tmp_path: Path,
+):
+    """Test that dots inside a file name are kept as-is."""
+    assert storage._get_file_path("/my..backup.tar") == tmp_path / "my..backup.tar"
+
+
+@pytest.mark.asyncio
+async def test_upload_creates_parent_directories(
+    storage: LocalStorageProvider, tmp_path: Path
+):
+    """Test that uploads create missing directories and overwrite files."""
+    await storage.upload("a/b/c.txt", b"first")
+    await storage.upload("a/b/c.txt", b"2nd")
+
+    assert (tmp_path / "a" / "b" / "c.txt").read_bytes() == b"2nd"
+
+
+@pytest.mark.asyncio
+async def test_upload_stream(storage: LocalStorageProvider):
+    """Test uploading from a file-like object."""
+    result = await storage.upload_stream("big.bin", io.BytesIO(b"x" * 100_000))
+
+    assert result.size == 100_000
+    assert await storage.download("big.bin") == b"x" * 100_000
@@ -1,7 +1,19 @@
 """User endpoint tests."""
 
+import time
+from dataclasses import replace
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import Update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.auth import AuthUser
+from src.adapters.auth.mock import MockAuthProvider
+from src.api import deps
+from src.main import app
+from src.models.user import User
 
 
 @pytest.mark.asyncio
@@ -23,6 +35,110 @@ async def test_get_current_user(
     assert data["is_active"] is True
 
 
+@pytest.mark.asyncio
+async def test_get_current_user_among_local_users(
+    client: AsyncClient,
+    users_pair: tuple[User, User],
+    auth_headers: dict[str, str],
+):
+    """Test that users without an external ID are resolved by email."""
+    response = await client.get(
+        "/api/v1/users/me",
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "test@example.com"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("external_id", "email"),
+    [
+        ("cognito-sub", "renamed@example.com"),  # Matched by external ID
+        ("unknown-sub", "cognito@example.com"),  # Falls back to email
+        ("cognito-sub", "test@example.com"),  # External ID wins over email
+    ],
+)
+async def test_get_current_user_with_external_id(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user,
+    external_id: str,
+    email: str,
+):
+    """Test resolving a provider user that has an external ID."""
+    user = User(
+        email="cognito@example.com",
+        name="Cognito User",
+        external_id="cognito-sub",
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    auth_user = AuthUser(
+        id=external_id,
+        email=email,
+        name="Cognito User",
+        external_id=external_id,
+    )
+    app.dependency_overrides[deps.get_current_auth_user] = lambda: auth_user
+
+    response = await client.get("/api/v1/users/me")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == user.id
+
+
+@pytest.mark.asyncio
+async def test_token_verification_is_cached(
+    client: AsyncClient,
+    test_user,
+    auth_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that repeated requests with one token verify it once."""
+    calls = []
+    verify_token = MockAuthProvider.verify_token
+
+    async def counting_verify_token(self, token):
+        calls.append(token)
+        return await verify_token(self, token)
+
+    monkeypatch.setattr(MockAuthProvider, "verify_token", counting_verify_token)
+
+    for _ in range(3):
+        response = await client.get("/api/v1/users/me", headers=auth_headers)
+        assert response.status_code == 200
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_is_not_cached_past_expiry(
+    client: AsyncClient,
+    test_user,
+    auth_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a token at its expiry is verified on every request."""
+    calls = []
+    verify_token = MockAuthProvider.verify_token
+
+    async def expiring_verify_token(self, token):
+        calls.append(token)
+        auth_user = await verify_token(self, token)
+        return replace(auth_user, expires_at=time.time())
+
+    monkeypatch.setattr(MockAuthProvider, "verify_token", expiring_verify_token)
+
+    for _ in range(2):
+        response = await client.get("/api/v1/users/me", headers=auth_headers)
+        assert response.status_code == 200
+
+    assert len(calls) == 2
+
+
 @pytest.mark.asyncio
 async def test_get_current_user_unauthorized(client: AsyncClient):
     """Test getting current user without auth."""
@@ -62,10 +178,90 @@ async def test_update_current_user(
 
 
 @pytest.mark.asyncio
-async def test_list_users_as_superuser(
+async def test_update_current_user_email(
     client: AsyncClient,
     test_user,
-    superuser,
+    auth_headers: dict[str, str],
+):
+    """Test changing the current user's email to an unused one."""
+    response = await client.patch(
+        "/api/v1/users/me",
+        headers=auth_headers,
+        json={"email": "renamed@example.com"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "renamed@example.com"
+    assert test_user.email == "renamed@example.com"
+
+
+@pytest.mark.asyncio
+async def test_update_current_user_email_taken(
+    client: AsyncClient,
+    users_pair: tuple[User, User],
+    auth_headers: dict[str, str],
+):
+    """Test that an email used by another user is rejected."""
+    test_user, _ = users_pair
+    response = await client.patch(
+        "/api/v1/users/me",
+        headers=auth_headers,
+        json={"name": "Updated Name", "email": "Admin@Example.com"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already in use"
+    assert test_user.name == "Test User"
+
+
+@pytest.mark.asyncio
+async def test_update_current_user_email_race(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user,
+    auth_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that losing a concurrent email update to the unique index is a 400."""
+    execute = db_session.execute
+
+    async def execute_with_conflict(statement, *args, **kwargs):
+        if isinstance(statement, Update):
+            raise IntegrityError(str(statement), {}, Exception("ix_users_email_lower"))
+        return await execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db_session, "execute", execute_with_conflict)
+    response = await client.patch(
+        "/api/v1/users/me",
+        headers=auth_headers,
+        json={"email": "taken@example.com"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already in use"
+
+
+@pytest.mark.asyncio
+async def test_update_current_user_unchanged(
+    client: AsyncClient,
+    test_user,
+    auth_headers: dict[str, str],
+):
+    """Test that an update matching the stored values is a no-op."""
+    response = await client.patch(
+        "/api/v1/users/me",
+        headers=auth_headers,
+        json={"name": "Test User", "email": "test@example.com"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Test User"
+
+
+@pytest.mark.asyncio
+async def test_list_users_as_superuser(
+    client: AsyncClient,
+    users_pair: tuple[User, User],
     superuser_headers: dict[str, str],
 ):
     """Test listing users as superuser."""
@@ -98,11 +294,11 @@ async def test_list_users_as_regular_user(
 @pytest.mark.asyncio
 async def test_get_user_by_id(
     client: AsyncClient,
-    test_user,
-    superuser,
+    users_pair: tuple[User, User],
     superuser_headers: dict[str, str],
 ):
     """Test getting user by ID as superuser."""
+    test_user, _ = users_pair
     response = await client.get(
         f"/api/v1/users/{test_user.id}",
         headers=superuser_headers,
@@ -131,11 +327,11 @@ async def test_get_user_not_found(
 @pytest.mark.asyncio
 async def test_delete_user(
     client: AsyncClient,
-    test_user,
-    superuser,
+    users_pair: tuple[User, User],
     superuser_headers: dict[str, str],
 ):
     """Test deleting a user as superuser."""
+    test_user, _ = users_pair
     response = await client.delete(
         f"/api/v1/users/{test_user.id}",
         headers=superuser_headers,
@@ -143,6 +339,38 @@ async def test_delete_user(
 
     assert response.status_code == 204
 
+    response = await client.get(
+        f"/api/v1/users/{test_user.id}",
+        headers=superuser_headers,
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_user_evicts_cached_auth(
+    client: AsyncClient,
+    users_pair: tuple[User, User],
+    auth_headers: dict[str, str],
+    superuser_headers: dict[str, str],
+):
+    """Test that deleting a user drops their cached token and user ID."""
+    test_user, _ = users_pair
+    response = await client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 200
+
+    response = await client.delete(
+        f"/api/v1/users/{test_user.id}",
+        headers=superuser_headers,
+    )
+    assert response.status_code == 204
+
+    # Only the superuser's entries are left
+    assert len(deps._token_cache) == 1
+    assert len(deps._user_id_cache) == 1
+
+    response = await client.get("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 404
+
 
 @pytest.mark.asyncio
 async def test_delete_self(